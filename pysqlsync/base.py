@@ -11,6 +11,7 @@ import abc
 import dataclasses
 import json
 import logging
+import operator
 import types
 from dataclasses import dataclass
 from typing import Any, Callable, Iterable, Optional, Sized, TypeVar, Union, overload
@@ -20,6 +21,7 @@ from strong_typing.inspection import DataclassInstance, is_dataclass_type, is_ty
 from strong_typing.name import python_type_to_str
 
 from pysqlsync.python_types import dataclass_to_code, module_to_code
+from pysqlsync.util.iterable import chunked
 
 from .formation.inspection import get_entity_types
 from .formation.mutation import Mutator, MutatorOptions
@@ -145,6 +147,10 @@ class BaseGenerator(abc.ABC):
     converter: DataclassConverter
     state: Catalog
 
+    _record_builders: dict[
+        tuple[type[DataclassInstance], bool], tuple[Table, Callable[[Any], tuple]]
+    ]
+
     def __init__(
         self,
         options: GeneratorOptions,
@@ -158,6 +164,7 @@ class BaseGenerator(abc.ABC):
 
     def reset(self) -> None:
         self.state = Catalog([])
+        self._record_builders = {}
 
     @overload
     def create(self, *, tables: list[type[DataclassInstance]]) -> Optional[str]: ...
@@ -188,9 +195,10 @@ class BaseGenerator(abc.ABC):
             if not tables:
                 LOGGER.warning("no tables to create")
 
-            for table in tables:
-                code = dataclass_to_code(table)
-                LOGGER.debug(f"analyzing dataclass `{table.__name__}`:\n{code}")
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                for table in tables:
+                    code = dataclass_to_code(table)
+                    LOGGER.debug(f"analyzing dataclass `{table.__name__}`:\n{code}")
 
             target = self.converter.dataclasses_to_catalog(tables)
             statement = self.get_mutate_stmt(target)
@@ -200,9 +208,10 @@ class BaseGenerator(abc.ABC):
             if not modules:
                 LOGGER.warning("no schemas to create")
 
-            for module in modules:
-                code = module_to_code(module)
-                LOGGER.debug(f"analyzing module `{module.__name__}`:\n{code}")
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                for module in modules:
+                    code = module_to_code(module)
+                    LOGGER.debug(f"analyzing module `{module.__name__}`:\n{code}")
 
             target = self.converter.modules_to_catalog(modules)
             statement = self.get_mutate_stmt(target)
@@ -373,10 +382,10 @@ class BaseGenerator(abc.ABC):
         table_object = self.state.get_table(
             self.get_qualified_id(ClassRef(entity_type))
         )
-        extractors = self._get_dataclass_extractors(
+        builder = self._get_dataclass_record_builder(
             table_object, entity_type, skip_identity=skip_identity
         )
-        return tuple(extractor(item) for extractor in extractors)
+        return builder(item)
 
     def get_dataclasses_as_records(
         self,
@@ -390,31 +399,124 @@ class BaseGenerator(abc.ABC):
         table_object = self.state.get_table(
             self.get_qualified_id(ClassRef(entity_type))
         )
-        extractors = self._get_dataclass_extractors(
+        builder = self._get_dataclass_record_builder(
             table_object, entity_type, skip_identity=skip_identity
         )
-        return (tuple(extractor(item) for extractor in extractors) for item in items)
+        return map(builder, items)
 
-    def _get_dataclass_extractors(
+    def _get_dataclass_record_builder(
         self, table: Table, entity_type: type[DataclassInstance], *, skip_identity: bool
-    ) -> tuple[Callable[[Any], Any], ...]:
-        "Returns a tuple of callable function objects that extracts each field of a data-class."
+    ) -> Callable[[Any], tuple]:
+        """
+        Returns a callable function object that converts a data-class object into a record.
+
+        Record builders are cached per data-class type, and are re-built only when the table they target changes.
+        """
+
+        key = (entity_type, skip_identity)
+        cached = self._record_builders.get(key)
+        if cached is not None:
+            cached_table, cached_builder = cached
+            if cached_table is table:
+                return cached_builder
+
+        builder = self._create_record_builder(table, entity_type, skip_identity)
+        self._record_builders[key] = (table, builder)
+        return builder
 
-        return tuple(
-            self.get_field_extractor(table.columns[field.name], field.name, field.type)
+    def _create_record_builder(
+        self, table: Table, entity_type: type[DataclassInstance], skip_identity: bool
+    ) -> Callable[[Any], tuple]:
+        """
+        Creates a callable function object that converts a data-class object into a record.
+
+        Fields with an attribute path (e.g. `field` or `field.value`) are fetched with a single multi-attribute getter,
+        which builds the tuple in C. Remaining (computed) fields are substituted in a post-processing step.
+        """
+
+        names: list[str] = []
+        extractors: list[tuple[int, Callable[[Any], Any]]] = []
+        for index, field in enumerate(
+            field
             for field in dataclasses.fields(entity_type)
             if not (skip_identity and table.columns[field.name].identity)
-        )
+        ):
+            column = table.columns[field.name]
+            path = self.get_field_path(column, field.name, field.type)  # type: ignore
+            if path is not None:
+                names.append(path)
+            else:
+                extractor = self.get_field_extractor(column, field.name, field.type)  # type: ignore
+                names.append(field.name)
+                extractors.append((index, extractor))
+
+        if not names:
+            return lambda obj: ()
+        elif len(names) == 1:
+            # a single-attribute getter returns a value, not a tuple
+            getter = extractors[0][1] if extractors else operator.attrgetter(names[0])
+            return lambda obj: (getter(obj),)
+        elif len(extractors) == len(names):
+            fns = tuple(extractor for _, extractor in extractors)
+            return lambda obj: tuple(fn(obj) for fn in fns)
+        elif extractors:
+            multi_getter = operator.attrgetter(*names)
+
+            def _build(obj: Any) -> tuple:
+                record = list(multi_getter(obj))
+                for index, extractor in extractors:
+                    record[index] = extractor(obj)
+                return tuple(record)
+
+            return _build
+        else:
+            return operator.attrgetter(*names)
 
-    def get_field_extractor(
+    def get_field_path(
         self, column: Column, field_name: str, field_type: type
-    ) -> Callable[[Any], Any]:
-        "Returns a callable function object that extracts a single field of a data-class."
+    ) -> Optional[str]:
+        """
+        Returns the dotted attribute path that fetches the value of a single field of a data-class.
+
+        Override in engine-specific derived classes to read a different attribute of the field value (e.g.
+        `field.bytes`). Return `None` for fields whose value is computed, and override `get_field_extractor`.
+        """
 
         if is_type_enum(field_type):
-            return lambda obj: getattr(obj, field_name).value
+            return f"{field_name}.value"
         else:
-            return lambda obj: getattr(obj, field_name)
+            return field_name
+
+    def get_field_extractor(
+        self, column: Column, field_name: str, field_type: type
+    ) -> Callable[[Any], Any]:
+        """
+        Returns a callable function object that extracts a single field of a data-class.
+
+        Only invoked for fields for which `get_field_path` returns `None`.
+        """
+
+        path = self.get_field_path(column, field_name, field_type)
+        if path is None:
+            raise NotImplementedError(
+                f"missing extractor for computed field: {field_name}"
+            )
+        return operator.attrgetter(path)
+
+    def get_input_sizes(
+        self, table: Table, order: Optional[tuple[str, ...]] = None
+    ) -> Optional[list[Any]]:
+        """
+        Returns driver-specific type information for each column bound as a parameter in a prepared statement.
+
+        Override in engine-specific derived classes whose database driver benefits from explicit parameter types.
+
+        :param table: The table whose columns are bound as parameters.
+        :param order: The column names in the order they appear in a record.
+        :returns: A list of driver-specific type descriptors, or `None` to let the driver infer parameter types.
+        """
+
+        return None
 
     def get_value_transformer(
         self, column: Column, field_type: type
@@ -508,9 +610,17 @@ class BaseConnection(abc.ABC):
 
 
 class BaseContext(abc.ABC):
-    "Context object returned by a connection object."
+    """
+    Context object returned by a connection object.
+
+    The class attribute `chunk_size` sets the maximum number of records passed to the database driver in a single
+    batch. Override it in a derived class or assign it on an instance.
+
+    :param connection: The connection that has created this context.
+    """
 
     connection: BaseConnection
+    chunk_size: int = 10000
 
     def __init__(self, connection: BaseConnection) -> None:
         self.connection = connection
@@ -678,7 +788,8 @@ class BaseContext(abc.ABC):
         generator = self.connection.generator
         statement = generator.get_dataclass_insert_stmt(table)
         records = generator.get_dataclasses_as_records(table, data, skip_identity=True)
-        await self.execute_all(statement, records)
+        for batch in chunked(records, self.chunk_size):
+            await self.execute_all(statement, batch)
 
     async def upsert_data(self, table: type[D], data: Iterable[D]) -> None:
         "Inserts or updates data in the database table corresponding to the dataclass type."
@@ -690,7 +801,8 @@ class BaseContext(abc.ABC):
         generator = self.connection.generator
         statement = generator.get_dataclass_upsert_stmt(table)
         records = generator.get_dataclasses_as_records(table, data, skip_identity=False)
-        await self.execute_all(statement, records)
+        for batch in chunked(records, self.chunk_size):
+            await self.execute_all(statement, batch)
 
     async def delete_data(
         self, table: type[DataclassInstance], keys: Iterable[Any]
@@ -754,7 +866,7 @@ class BaseContext(abc.ABC):
         record_generator = await self._generate_records(
             table, records, field_types=field_types, field_names=field_names
         )
-        order = tuple(name for name in field_names if name) if field_names else None
+        order = self._resolve_order(field_names)
         statement = self.connection.generator.get_table_insert_stmt(table, order)
         await self._execute_typed(statement, record_generator, table, order)
 
@@ -809,10 +921,18 @@ class BaseContext(abc.ABC):
         record_generator = await self._generate_records(
             table, records, field_types=field_types, field_names=field_names
         )
-        order = tuple(name for name in field_names if name) if field_names else None
+        order = self._resolve_order(field_names)
         statement = self.connection.generator.get_table_upsert_stmt(table, order)
         await self._execute_typed(statement, record_generator, table, order)
 
+    @staticmethod
+    def _resolve_order(
+        field_names: Optional[tuple[str, ...]]
+    ) -> Optional[tuple[str, ...]]:
+        "Column order implied by record field labels, skipping omitted (empty) labels."
+
+        return tuple(name for name in field_names if name) if field_names else None
+
     async def _generate_records(
         self,
         table: Table,
@@ -1112,7 +1232,9 @@ class Explorer(abc.ABC):
             LOGGER.debug(f"found {len(ns.enums)} enum(s) in namespace {ns.name}")
             LOGGER.debug(f"found {len(ns.structs)} struct(s) in namespace {ns.name}")
             LOGGER.debug(f"found {len(ns.tables)} table(s) in namespace {ns.name}")
-        LOGGER.debug(f"discovered state:\n{str(generator.state)}")
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            # rendering the state emits DDL for every object in the catalog
+            LOGGER.debug(f"discovered state:\n{str(generator.state)}")
 
     @overload
     async def synchronize(self, *, module: types.ModuleType) -> None: ...
@@ -1149,7 +1271,8 @@ class Explorer(abc.ABC):
         generator.reset()
         generator.create(tables=get_entity_types(entity_modules))
         target_state = generator.state
-        LOGGER.debug(f"desired state:\n{str(generator.state)}")
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(f"desired state:\n{str(generator.state)}")
 
         # acquire current database schema
         await self.discover(modules=entity_modules)
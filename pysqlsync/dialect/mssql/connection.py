@@ -1,5 +1,6 @@
 import logging
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Iterable, Optional, TypeVar
 
 import pyodbc
@@ -8,13 +9,12 @@ from strong_typing.inspection import is_dataclass_type
 from pysqlsync.base import BaseConnection, BaseContext
 from pysqlsync.formation.object_types import Table
 from pysqlsync.model.data_types import quote
-from pysqlsync.model.id_types import LocalId, QualifiedId
+from pysqlsync.model.id_types import LocalId
 from pysqlsync.resultset import resultset_unwrap_object, resultset_unwrap_tuple
 from pysqlsync.util.dispatch import thread_dispatch
+from pysqlsync.util.iterable import chunked
 from pysqlsync.util.typing import override
 
-from .data_types import sql_to_odbc_type
-
 T = TypeVar("T")
 
 LOGGER = logging.getLogger("pysqlsync.mssql")
@@ -26,10 +26,29 @@ class MSSQLConnection(BaseConnection):
     """
 
     native: pyodbc.Connection
+    executor: ThreadPoolExecutor
 
     @override
+    async def open(self) -> BaseContext:
+        # a dedicated thread keeps all calls on the native connection in order and on the same thread
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=LOGGER.name
+        )
+        try:
+            return await self._open()
+        except BaseException:
+            self.executor.shutdown()
+            raise
+
+    @override
+    async def close(self) -> None:
+        try:
+            await self._close()
+        finally:
+            self.executor.shutdown()
+
     @thread_dispatch
-    def open(self) -> BaseContext:
+    def _open(self) -> BaseContext:
         LOGGER.info(f"connecting to {self.params}")
         params = {
             "DRIVER": "{ODBC Driver 18 for SQL Server}",
@@ -52,9 +71,8 @@ class MSSQLConnection(BaseConnection):
         self.native = conn
         return MSSQLContext(self)
 
-    @override
     @thread_dispatch
-    def close(self) -> None:
+    def _close(self) -> None:
         self.native.close()
 
 
@@ -66,6 +84,10 @@ class MSSQLContext(BaseContext):
     def native_connection(self) -> pyodbc.Connection:
         return typing.cast(MSSQLConnection, self.connection).native
 
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        return typing.cast(MSSQLConnection, self.connection).executor
+
     @override
     @thread_dispatch
     def _execute(self, statement: str) -> None:
@@ -77,7 +99,8 @@ class MSSQLContext(BaseContext):
     def _execute_all(self, statement: str, args: Iterable[tuple[Any, ...]]) -> None:
         with self.native_connection.cursor() as cur:
             cur.fast_executemany = True
-            cur.executemany(statement, args)
+            for batch in chunked(args, self.chunk_size):
+                cur.executemany(statement, batch)
 
     @override
     @thread_dispatch
@@ -90,13 +113,10 @@ class MSSQLContext(BaseContext):
     ) -> None:
         with self.native_connection.cursor() as cur:
             cur.fast_executemany = True
-            cur.setinputsizes(
-                [
-                    sql_to_odbc_type(column.data_type)
-                    for column in table.get_columns(order)
-                ]
-            )
-            cur.executemany(statement, records)
+            generator = self.connection.generator
+            cur.setinputsizes(generator.get_input_sizes(table, order))
+            for batch in chunked(records, self.chunk_size):
+                cur.executemany(statement, batch)
 
     @override
     @thread_dispatch
@@ -113,31 +133,25 @@ class MSSQLContext(BaseContext):
     async def drop_schema(self, namespace: LocalId) -> None:
         LOGGER.debug(f"drop schema: {namespace}")
 
-        constraints = await self.query_all(
-            tuple[str, str],
-            "SELECT table_name, constraint_name\n"
-            "FROM information_schema.table_constraints\n"
-            f"WHERE constraint_type = 'FOREIGN KEY' AND table_schema = {quote(namespace.id)};",
+        # drop foreign keys and tables in the schema, and the schema itself, in a single batch
+        schema_name = quote(namespace.id)
+        await self.execute(
+            "DECLARE @stmt nvarchar(max);\n"
+            "SELECT @stmt = STRING_AGG(CAST(\n"
+            "    'ALTER TABLE ' + QUOTENAME(s.name) + '.' + QUOTENAME(t.name) + ' DROP CONSTRAINT ' + QUOTENAME(fk.name)\n"
+            "AS nvarchar(max)), ';')\n"
+            "FROM sys.foreign_keys AS fk\n"
+            "    INNER JOIN sys.tables AS t ON fk.parent_object_id = t.object_id\n"
+            "    INNER JOIN sys.schemas AS s ON t.schema_id = s.schema_id\n"
+            f"WHERE s.name = {schema_name};\n"
+            "IF @stmt IS NOT NULL EXEC sp_executesql @stmt;\n"
+            "SET @stmt = NULL;\n"
+            "SELECT @stmt = 'DROP TABLE ' + STRING_AGG(CAST(\n"
+            "    QUOTENAME(s.name) + '.' + QUOTENAME(t.name)\n"
+            "AS nvarchar(max)), ', ')\n"
+            "FROM sys.tables AS t\n"
+            "    INNER JOIN sys.schemas AS s ON t.schema_id = s.schema_id\n"
+            f"WHERE s.name = {schema_name};\n"
+            "IF @stmt IS NOT NULL EXEC sp_executesql @stmt;\n"
+            f"DROP SCHEMA IF EXISTS {namespace};"
         )
-        if constraints:
-            stmts: list[str] = []
-            for constraint in constraints:
-                table_name, constraint_name = typing.cast(tuple[str, str], constraint)
-                stmts.append(
-                    f"ALTER TABLE {QualifiedId(namespace.id, table_name)} DROP CONSTRAINT {LocalId(constraint_name)};"
-                )
-            await self.execute("\n".join(stmts))
-
-        tables = await self.query_all(
-            str,
-            "SELECT table_name\n"
-            "FROM information_schema.tables\n"
-            f"WHERE table_schema = {quote(namespace.id)};",
-        )
-        if tables:
-            table_list = ", ".join(
-                str(QualifiedId(namespace.local_id, table)) for table in tables
-            )
-            await self.execute(f"DROP TABLE IF EXISTS {table_list};")
-
-        await self.execute(f"DROP SCHEMA IF EXISTS {namespace};")
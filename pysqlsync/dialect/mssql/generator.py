@@ -7,7 +7,7 @@ from strong_typing.core import JsonType
 
 from pysqlsync.base import BaseGenerator, GeneratorOptions
 from pysqlsync.formation.inspection import is_ip_address_type
-from pysqlsync.formation.object_types import Column, FormationError
+from pysqlsync.formation.object_types import Column, FormationError, Table
 from pysqlsync.formation.py_to_sql import (
     ArrayMode,
     DataclassConverter,
@@ -17,9 +17,15 @@ from pysqlsync.formation.py_to_sql import (
     StructMode,
 )
 from pysqlsync.model.data_types import SqlFixedBinaryType
+from pysqlsync.model.id_types import SupportsQualifiedId
 from pysqlsync.util.typing import override
 
-from .data_types import MSSQLBooleanType, MSSQLDateTimeType, MSSQLVariableCharacterType
+from .data_types import (
+    MSSQLBooleanType,
+    MSSQLDateTimeType,
+    MSSQLVariableCharacterType,
+    sql_to_odbc_type,
+)
 from .mutation import MSSQLMutator
 from .object_types import MSSQLObjectFactory
 
@@ -31,6 +37,11 @@ class MSSQLGenerator(BaseGenerator):
     Assumes a UTF-8 collation and `SET ANSI_DEFAULTS ON`. UTF-8 collation makes `varchar` store UTF-8 characters.
     """
 
+    _input_sizes: dict[
+        tuple[SupportsQualifiedId, Optional[tuple[str, ...]]],
+        tuple[Table, list[tuple[int, int, int]]],
+    ]
+
     def __init__(self, options: GeneratorOptions) -> None:
         super().__init__(
             options, MSSQLObjectFactory(), MSSQLMutator(options.synchronization)
@@ -71,6 +82,11 @@ class MSSQLGenerator(BaseGenerator):
             )
         )
 
+    @override
+    def reset(self) -> None:
+        super().reset()
+        self._input_sizes = {}
+
     @override
     def get_current_schema_stmt(self) -> str:
         return "SCHEMA_NAME()"
@@ -80,15 +96,38 @@ class MSSQLGenerator(BaseGenerator):
         return "?"
 
     @override
-    def get_field_extractor(
+    def get_field_path(
         self, column: Column, field_name: str, field_type: type
-    ) -> Callable[[Any], Any]:
+    ) -> Optional[str]:
         if field_type is uuid.UUID:
-            return lambda obj: getattr(obj, field_name).bytes
+            return f"{field_name}.bytes"
         elif is_ip_address_type(field_type):
-            return lambda obj: getattr(obj, field_name).packed
+            return f"{field_name}.packed"
+
+        return super().get_field_path(column, field_name, field_type)
+
+    @override
+    def get_input_sizes(
+        self, table: Table, order: Optional[tuple[str, ...]] = None
+    ) -> list[tuple[int, int, int]]:
+        """
+        Returns the ODBC data types to pass to `setinputsizes` for the given columns of a table.
+
+        Data types are cached per table and column order, and are re-computed when the table object changes.
+        """
+
+        key = (table.name, order)
+        cached = self._input_sizes.get(key)
+        if cached is not None:
+            cached_table, input_sizes = cached
+            if cached_table is table:
+                return input_sizes
 
-        return super().get_field_extractor(column, field_name, field_type)
+        input_sizes = [
+            sql_to_odbc_type(column.data_type) for column in table.get_columns(order)
+        ]
+        self._input_sizes[key] = (table, input_sizes)
+        return input_sizes
 
     @override
     def get_value_transformer(
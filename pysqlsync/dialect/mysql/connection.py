@@ -9,6 +9,7 @@ from pysqlsync.base import BaseConnection, BaseContext
 from pysqlsync.model.data_types import escape_like
 from pysqlsync.model.id_types import LocalId
 from pysqlsync.resultset import resultset_unwrap_dict, resultset_unwrap_tuple
+from pysqlsync.util.iterable import chunked
 from pysqlsync.util.typing import override
 
 D = TypeVar("D", bound=DataclassInstance)
@@ -65,7 +66,8 @@ class MySQLContext(BaseContext):
         self, statement: str, args: Iterable[tuple[Any, ...]]
     ) -> None:
         async with self.native_connection.cursor() as cur:
-            await cur.executemany(statement, args)
+            for batch in chunked(args, self.chunk_size):
+                await cur.executemany(statement, batch)
 
     @override
     async def _query_all(self, signature: type[T], statement: str) -> list[T]:
@@ -18,11 +18,7 @@ class MySQLTable(Table):
         if self.description is None:
             return None
 
-        return (
-            self.description
-            if "\n" not in self.description
-            else self.description[: self.description.index("\n")]
-        )
+        return self.description.partition("\n")[0]
 
     def create_stmt(self) -> str:
         defs: list[str] = []
@@ -48,25 +44,25 @@ class MySQLEnumTable(EnumTable, MySQLTable):
 class MySQLColumn(Column):
     @property
     def data_spec(self) -> str:
-        charset = (
-            " CHARACTER SET ascii COLLATE ascii_bin"
-            if isinstance(self.data_type, SqlEnumType)
-            else ""
-        )
-        nullable = " NOT NULL" if not self.nullable else ""
-        default = f" DEFAULT {self.default}" if self.default is not None else ""
-        identity = " AUTO_INCREMENT" if self.identity else ""
-        description = f" COMMENT {self.comment}" if self.description is not None else ""
-        return f"{self.data_type}{charset}{nullable}{default}{identity}{description}"
+        parts = [str(self.data_type)]
+        if isinstance(self.data_type, SqlEnumType):
+            parts.append(" CHARACTER SET ascii COLLATE ascii_bin")
+        if not self.nullable:
+            parts.append(" NOT NULL")
+        if self.default is not None:
+            parts.append(" DEFAULT ")
+            parts.append(self.default)
+        if self.identity:
+            parts.append(" AUTO_INCREMENT")
+        if self.description is not None:
+            parts.append(" COMMENT ")
+            parts.append(str(self.comment))
+        return "".join(parts)
 
     @property
     def comment(self) -> Optional[str]:
         if self.description is not None:
-            description = (
-                self.description
-                if "\n" not in self.description
-                else self.description[: self.description.index("\n")]
-            )
+            description = self.description.partition("\n")[0]
 
             if len(description) > 1024:
                 raise FormationError(
@@ -1,6 +1,7 @@
 import logging
 import re
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Iterable, Optional, TypeVar
 
 import oracledb
@@ -12,6 +13,7 @@ from pysqlsync.model.data_types import escape_like
 from pysqlsync.model.id_types import LocalId
 from pysqlsync.resultset import resultset_unwrap_tuple
 from pysqlsync.util.dispatch import thread_dispatch
+from pysqlsync.util.iterable import chunked
 from pysqlsync.util.typing import override
 
 from .data_types import sql_to_oracle_type
@@ -24,10 +26,29 @@ LOGGER = logging.getLogger("pysqlsync.oracle")
 
 class OracleConnection(BaseConnection):
     native: oracledb.Connection
+    executor: ThreadPoolExecutor
 
     @override
+    async def open(self) -> BaseContext:
+        # a dedicated thread keeps all calls on the native connection in order and on the same thread
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=LOGGER.name
+        )
+        try:
+            return await self._open()
+        except BaseException:
+            self.executor.shutdown()
+            raise
+
+    @override
+    async def close(self) -> None:
+        try:
+            await self._close()
+        finally:
+            self.executor.shutdown()
+
     @thread_dispatch
-    def open(self) -> BaseContext:
+    def _open(self) -> BaseContext:
         LOGGER.info(f"connecting to {self.params}")
 
         host = self.params.host or "localhost"
@@ -46,9 +67,8 @@ class OracleConnection(BaseConnection):
         self.native = conn
         return OracleContext(self)
 
-    @override
     @thread_dispatch
-    def close(self) -> None:
+    def _close(self) -> None:
         self.native.close()
 
 
@@ -60,6 +80,10 @@ class OracleContext(BaseContext):
     def native_connection(self) -> oracledb.Connection:
         return typing.cast(OracleConnection, self.connection).native
 
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        return typing.cast(OracleConnection, self.connection).executor
+
     @override
     @thread_dispatch
     def _execute(self, statement: str) -> None:
@@ -79,7 +103,8 @@ class OracleContext(BaseContext):
     def _execute_all(self, statement: str, records: Iterable[tuple[Any, ...]]) -> None:
         statement = statement.rstrip("\r\n\t\v ;")
         with self.native_connection.cursor() as cur:
-            cur.executemany(statement, list(records))
+            for batch in chunked(records, self.chunk_size):
+                cur.executemany(statement, batch)
 
     @override
     @thread_dispatch
@@ -92,13 +117,13 @@ class OracleContext(BaseContext):
     ) -> None:
         statement = statement.rstrip("\r\n\t\v ;")
         with self.native_connection.cursor() as cur:
-            cur.setinputsizes(
-                *tuple(
-                    sql_to_oracle_type(cur, column.data_type)
-                    for column in table.get_columns(order)
-                )
+            input_sizes = tuple(
+                sql_to_oracle_type(cur, column.data_type)
+                for column in table.get_columns(order)
             )
-            cur.executemany(statement, list(records))
+            for batch in chunked(records, self.chunk_size):
+                cur.setinputsizes(*input_sizes)
+                cur.executemany(statement, batch)
 
     @override
     @thread_dispatch
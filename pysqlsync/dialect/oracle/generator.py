@@ -94,14 +94,23 @@ class OracleGenerator(BaseGenerator):
         return f":{index}"
 
     @override
-    def get_field_extractor(
+    def get_field_path(
         self, column: Column, field_name: str, field_type: type
-    ) -> Callable[[Any], Any]:
+    ) -> Optional[str]:
         if field_type is uuid.UUID:
-            return lambda obj: getattr(obj, field_name).bytes
+            return f"{field_name}.bytes"
         elif is_ip_address_type(field_type):
-            return lambda obj: getattr(obj, field_name).packed
+            return f"{field_name}.packed"
         elif field_type is datetime.time:
+            return None
+
+        return super().get_field_path(column, field_name, field_type)
+
+    @override
+    def get_field_extractor(
+        self, column: Column, field_name: str, field_type: type
+    ) -> Callable[[Any], Any]:
+        if field_type is datetime.time:
             return (
                 lambda obj: datetime.datetime.combine(
                     MIN_DATE, getattr(obj, field_name)
@@ -1,17 +1,20 @@
 import dataclasses
 import logging
 import typing
-from typing import Any, Iterable, Optional, TypeVar
+from typing import Any, Iterable, Optional, Sized, TypeVar
 
 import asyncpg
 from strong_typing.inspection import DataclassInstance, is_dataclass_type
 
 from pysqlsync.base import BaseConnection, BaseContext, ClassRef
 from pysqlsync.formation.object_types import Table
+from pysqlsync.model.id_types import LocalId
 from pysqlsync.model.properties import is_identity_type
 from pysqlsync.resultset import resultset_unwrap_dict, resultset_unwrap_tuple
 from pysqlsync.util.typing import override
 
+from .generator import PostgreSQLGenerator
+
 D = TypeVar("D", bound=DataclassInstance)
 T = TypeVar("T")
 
@@ -102,7 +105,7 @@ class PostgreSQLContext(BaseContext):
         record_generator = await self._generate_records(
             table, records, field_types=field_types, field_names=field_names
         )
-        order = tuple(name for name in field_names if name) if field_names else None
+        order = self._resolve_order(field_names)
         result = await self.native_connection.copy_records_to_table(
             schema_name=table.name.scope_id,
             table_name=table.name.local_id,
@@ -110,3 +113,73 @@ class PostgreSQLContext(BaseContext):
             records=record_generator,
         )
         LOGGER.debug(result)
+
+    @override
+    async def upsert_data(self, table: type[D], data: Iterable[D]) -> None:
+        if not is_dataclass_type(table):
+            raise TypeError(f"expected dataclass type, got: {table}")
+
+        # a single `executemany` round-trip beats creating a staging table for small batches
+        if isinstance(data, Sized) and len(data) <= self.chunk_size:
+            await super().upsert_data(table, data)
+            return
+
+        generator = self.connection.generator
+        records = generator.get_dataclasses_as_records(table, data, skip_identity=False)
+        await self._upsert_copy(self.get_table(table), records)
+
+    @override
+    async def _upsert_rows(
+        self,
+        table: Table,
+        records: Iterable[tuple[Any, ...]],
+        *,
+        field_types: tuple[type, ...],
+        field_names: Optional[tuple[str, ...]] = None,
+    ) -> None:
+        if isinstance(records, Sized) and len(records) <= self.chunk_size:
+            await super()._upsert_rows(
+                table, records, field_types=field_types, field_names=field_names
+            )
+            return
+
+        record_generator = await self._generate_records(
+            table, records, field_types=field_types, field_names=field_names
+        )
+        order = self._resolve_order(field_names)
+        await self._upsert_copy(table, record_generator, order)
+
+    async def _upsert_copy(
+        self,
+        table: Table,
+        records: Iterable[tuple[Any, ...]],
+        order: Optional[tuple[str, ...]] = None,
+    ) -> None:
+        """
+        Inserts or updates rows in a database table via a temporary staging table.
+
+        Used for large or unsized inputs. Records are bulk-copied into the staging table with `COPY`, and then merged
+        into the target table with a single `INSERT ... ON CONFLICT DO UPDATE` statement.
+        """
+
+        generator = typing.cast(PostgreSQLGenerator, self.connection.generator)
+        staging = LocalId(f"staging__{table.name.local_id}")
+        sequence = LocalId("__sequence")
+        columns = [str(col.name.local_id) for col in table.get_columns(order)]
+
+        async with self.native_connection.transaction():
+            await self.execute(
+                generator.get_staging_table_create_stmt(table, staging, sequence, order)
+            )
+            result = await self.native_connection.copy_records_to_table(
+                table_name=staging.local_id,
+                columns=columns,
+                records=records,
+            )
+            LOGGER.debug(result)
+            await self.execute(
+                generator.get_table_upsert_from_stmt(table, staging, sequence, order)
+            )
+
+            # `ON COMMIT DROP` applies to the outermost transaction only, drop explicitly when nested in a savepoint
+            await self.execute(f"DROP TABLE {staging};")
@@ -12,6 +12,7 @@ from pysqlsync.formation.py_to_sql import (
     NamespaceMapping,
     StructMode,
 )
+from pysqlsync.model.id_types import LocalId
 from pysqlsync.util.typing import override
 
 from .data_types import PostgreSQLJsonType
@@ -100,6 +101,62 @@ class PostgreSQLGenerator(BaseGenerator):
             self.placeholder(index) for index, _ in enumerate(columns, start=1)
         )
         statements.append(f"({column_list}) VALUES ({value_list})")
+        statements.extend(self._get_upsert_conflict_clause(table))
+        statements.append(";")
+        return "\n".join(statements)
+
+    def get_staging_table_create_stmt(
+        self,
+        table: Table,
+        staging: LocalId,
+        sequence: LocalId,
+        order: Optional[tuple[str, ...]] = None,
+    ) -> str:
+        """
+        Returns a SQL statement to create a temporary table that holds records to be merged into a database table.
+
+        The temporary table is dropped when the enclosing transaction commits. The sequence column preserves the
+        order in which records are copied into the temporary table.
+        """
+
+        column_list = ", ".join(str(column.name) for column in table.get_columns(order))
+        return (
+            f"CREATE TEMPORARY TABLE {staging} ON COMMIT DROP AS\n"
+            f"SELECT {column_list} FROM {table.name}\n"
+            "WITH NO DATA;\n"
+            f"ALTER TABLE {staging} ADD COLUMN {sequence} bigint GENERATED ALWAYS AS IDENTITY;"
+        )
+
+    def get_table_upsert_from_stmt(
+        self,
+        table: Table,
+        staging: LocalId,
+        sequence: LocalId,
+        order: Optional[tuple[str, ...]] = None,
+    ) -> str:
+        """
+        Returns a SQL statement to insert or update records in a database table, taking records from a staging table.
+
+        When the staging table contains several records with the same primary key, the record copied last wins,
+        which matches the outcome of executing the upsert statement for each record in sequence.
+        """
+
+        statements: list[str] = []
+        statements.append(f"INSERT INTO {table.name}")
+        column_list = ", ".join(str(column.name) for column in table.get_columns(order))
+        keys = ", ".join(str(key) for key in table.primary_key)
+        statements.append(f"({column_list})")
+        statements.append(
+            f"SELECT DISTINCT ON ({keys}) {column_list} FROM {staging} ORDER BY {keys}, {sequence} DESC"
+        )
+        statements.extend(self._get_upsert_conflict_clause(table))
+        statements.append(";")
+        return "\n".join(statements)
+
+    def _get_upsert_conflict_clause(self, table: Table) -> list[str]:
+        "Builds the conflict resolution part of a SQL INSERT statement that updates existing records."
+
+        statements: list[str] = []
         value_columns = table.get_value_columns()
         keys = ", ".join(str(key) for key in table.primary_key)
         if value_columns:
@@ -110,5 +167,4 @@ class PostgreSQLGenerator(BaseGenerator):
             statements.append(",\n".join(defs))
         else:
             statements.append(f"ON CONFLICT ({keys}) DO NOTHING")
-        statements.append(";")
-        return "\n".join(statements)
+        return statements
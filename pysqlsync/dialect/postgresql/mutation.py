@@ -39,10 +39,11 @@ class PostgreSQLMutator(Mutator):
         for target_column in target.columns.values():
             source_column = source.columns.get(target_column.name.id)
 
+            # an empty comment is no comment
             source_desc = (
                 source_column.description if source_column is not None else None
-            )
-            target_desc = target_column.description
+            ) or None
+            target_desc = target_column.description or None
 
             if target_desc is None:
                 if source_desc is not None:
@@ -55,13 +56,15 @@ class PostgreSQLMutator(Mutator):
                         f"COMMENT ON COLUMN {target.name}.{target_column.name} IS {sql_quoted_string(target_desc)};"
                     )
 
-        if target.description is None:
-            if source.description is not None:
+        source_desc = source.description or None
+        target_desc = target.description or None
+        if target_desc is None:
+            if source_desc is not None:
                 statements.append(f"COMMENT ON TABLE {target.name} IS NULL;")
         else:
-            if source.description != target.description:
+            if source_desc != target_desc:
                 statements.append(
-                    f"COMMENT ON TABLE {target.name} IS {sql_quoted_string(target.description)};"
+                    f"COMMENT ON TABLE {target.name} IS {sql_quoted_string(target_desc)};"
                 )
 
         return join_or_none(statements)
@@ -72,13 +75,35 @@ class PostgreSQLMutator(Mutator):
         statements: StatementList = StatementList()
         statements.append(super().mutate_struct_stmt(source, target))
 
-        if target.description is None:
-            if source.description is not None:
+        for target_member in target.members.values():
+            source_member = source.members.get(target_member.name.id)
+
+            # an empty comment is no comment
+            source_desc = (
+                source_member.description if source_member is not None else None
+            ) or None
+            target_desc = target_member.description or None
+
+            if target_desc is None:
+                if source_desc is not None:
+                    statements.append(
+                        f"COMMENT ON COLUMN {target.name}.{target_member.name} IS NULL;"
+                    )
+            else:
+                if source_desc != target_desc:
+                    statements.append(
+                        f"COMMENT ON COLUMN {target.name}.{target_member.name} IS {sql_quoted_string(target_desc)};"
+                    )
+
+        source_desc = source.description or None
+        target_desc = target.description or None
+        if target_desc is None:
+            if source_desc is not None:
                 statements.append(f"COMMENT ON TYPE {target.name} IS NULL;")
         else:
-            if source.description != target.description:
+            if source_desc != target_desc:
                 statements.append(
-                    f"COMMENT ON TYPE {target.name} IS {sql_quoted_string(target.description)};"
+                    f"COMMENT ON TYPE {target.name} IS {sql_quoted_string(target_desc)};"
                 )
 
         return join_or_none(statements)
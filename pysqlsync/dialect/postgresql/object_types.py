@@ -1,4 +1,3 @@
-import re
 from typing import Optional
 
 from pysqlsync.formation.object_types import (
@@ -10,22 +9,27 @@ from pysqlsync.formation.object_types import (
 )
 from pysqlsync.model.id_types import LocalId
 
-_sql_quoted_str_table = str.maketrans(
-    {
-        "\\": "\\\\",
-        "'": "\\'",
-        "\b": "\\b",
-        "\f": "\\f",
-        "\n": "\\n",
-        "\r": "\\r",
-        "\t": "\\t",
-    }
+# backslash must be escaped first so that escape sequences added later are left intact
+_sql_quoted_str_replacements = (
+    ("\\", "\\\\"),
+    ("'", "\\'"),
+    ("\b", "\\b"),
+    ("\f", "\\f"),
+    ("\n", "\\n"),
+    ("\r", "\\r"),
+    ("\t", "\\t"),
 )
 
+_sql_escaped_chars = frozenset("\b\f\n\r\t")
+
 
 def sql_quoted_string(text: str) -> str:
-    if re.search(r"[\b\f\n\r\t]", text):
-        string = text.translate(_sql_quoted_str_table)
+    # a C-level scan of the string that stops at the first control character
+    if not _sql_escaped_chars.isdisjoint(text):
+        # chained C-level substring replacement is much faster than a `str.translate` mapping characters to strings
+        string = text
+        for char, escape in _sql_quoted_str_replacements:
+            string = string.replace(char, escape)
         return f"E'{string}'"
     else:
         string = text.replace("'", "''")
@@ -37,16 +41,16 @@ class PostgreSQLTable(Table):
         statements: list[str] = []
         statements.append(super().create_stmt())
 
-        # output comments for table and column objects
-        if self.description is not None:
+        # output comments for table and column objects (an empty comment is no comment)
+        if self.description:
             statements.append(
                 f"COMMENT ON TABLE {self.name} IS {sql_quoted_string(self.description)};"
             )
-        for column in self.columns.values():
-            if column.description is not None:
-                statements.append(
-                    f"COMMENT ON COLUMN {self.name}.{column.name} IS {sql_quoted_string(column.description)};"
-                )
+        statements.extend(
+            f"COMMENT ON COLUMN {self.name}.{column.name} IS {sql_quoted_string(column.description)};"
+            for column in self.columns.values()
+            if column.description
+        )
         return "\n".join(statements)
 
     @property
@@ -63,15 +67,15 @@ class PostgreSQLStructType(StructType):
         statements: list[str] = []
         statements.append(super().create_stmt())
 
-        if self.description is not None:
+        if self.description:
             statements.append(
                 f"COMMENT ON TYPE {self.name} IS {sql_quoted_string(self.description)};"
             )
-        for member in self.members.values():
-            if member.description is not None:
-                statements.append(
-                    f"COMMENT ON COLUMN {self.name}.{member.name} IS {sql_quoted_string(member.description)};"
-                )
+        statements.extend(
+            f"COMMENT ON COLUMN {self.name}.{member.name} IS {sql_quoted_string(member.description)};"
+            for member in self.members.values()
+            if member.description
+        )
         return "\n".join(statements)
 
 
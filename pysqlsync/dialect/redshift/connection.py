@@ -2,6 +2,7 @@ import dataclasses
 import logging
 import re
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from typing import Any, Iterable, Optional, TypeVar
 
@@ -26,10 +27,29 @@ redshift_connector.paramstyle = "numeric"
 
 class RedshiftConnection(BaseConnection):
     native: redshift_connector.Connection
+    executor: ThreadPoolExecutor
 
     @override
+    async def open(self) -> BaseContext:
+        # a dedicated thread keeps all calls on the native connection in order and on the same thread
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=LOGGER.name
+        )
+        try:
+            return await self._open()
+        except BaseException:
+            self.executor.shutdown()
+            raise
+
+    @override
+    async def close(self) -> None:
+        try:
+            await self._close()
+        finally:
+            self.executor.shutdown()
+
     @thread_dispatch
-    def open(self) -> BaseContext:
+    def _open(self) -> BaseContext:
         LOGGER.info(f"connecting to {self.params}")
         conn = redshift_connector.connect(
             iam=True,
@@ -43,9 +63,8 @@ class RedshiftConnection(BaseConnection):
         self.native = conn
         return RedshiftContext(self)
 
-    @override
     @thread_dispatch
-    def close(self) -> None:
+    def _close(self) -> None:
         self.native.close()
 
 
@@ -57,6 +76,10 @@ class RedshiftContext(BaseContext):
     def native_connection(self) -> redshift_connector.Connection:
         return typing.cast(RedshiftConnection, self.connection).native
 
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        return typing.cast(RedshiftConnection, self.connection).executor
+
     @override
     @thread_dispatch
     def _execute(self, statement: str) -> None:
@@ -112,7 +135,7 @@ class RedshiftContext(BaseContext):
         field_types: tuple[type, ...],
         field_names: Optional[tuple[str, ...]] = None,
     ) -> None:
-        order = tuple(name for name in field_names if name) if field_names else None
+        order = self._resolve_order(field_names)
         columns = [col.name for col in table.get_columns(order)]
         record_generator = await self._generate_records(
             table, records, field_types=field_types, field_names=field_names
@@ -141,10 +164,10 @@ class RedshiftContext(BaseContext):
             for record in records:
                 f.write(b"|".join(str(value).encode("utf-8") for value in record))
                 f.write(b"\n")
-            stream_data = f.getvalue()
+            f.seek(0)
 
-        cursor = self.native_connection.cursor()
-        try:
-            cursor.execute(copy_query, stream=BytesIO(stream_data))
-        finally:
-            cursor.close()
+            cursor = self.native_connection.cursor()
+            try:
+                cursor.execute(copy_query, stream=f)
+            finally:
+                cursor.close()
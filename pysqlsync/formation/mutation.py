@@ -54,15 +54,18 @@ class Mutator:
     def mutate_enum_stmt(self, source: EnumType, target: EnumType) -> Optional[str]:
         self.check_identity(source, target)
 
+        source_values = set(source.values)
+        target_values = set(target.values)
+
         removed_values = [
-            value for value in source.values if value not in target.values
+            value for value in source.values if value not in target_values
         ]
         if removed_values:
             raise FormationError(
                 f"operation not permitted; cannot drop values in an enumeration: {''.join(removed_values)}"
             )
 
-        added_values = [value for value in target.values if value not in source.values]
+        added_values = [value for value in target.values if value not in source_values]
         if added_values:
             return (
                 f"ALTER TYPE {source.name}\n"
@@ -83,7 +86,7 @@ class Mutator:
             for member in source.members.difference(target.members)
         )
         for source_member, target_member in source.members.intersection(target.members):
-            if source_member != target_member:
+            if source_member.data_type != target_member.data_type:
                 statements.append(
                     f"ALTER ATTRIBUTE {source_member.name} SET DATA TYPE {target_member.data_type}"
                 )
@@ -148,6 +151,13 @@ class Mutator:
     def mutate_table_stmt(self, source: Table, target: Table) -> Optional[str]:
         self.check_identity(source, target)
 
+        # skip per-column comparison for tables that have not changed
+        if (
+            source.columns == target.columns
+            and source.constraints == target.constraints
+        ):
+            return None
+
         statements: list[Optional[str]] = []
 
         create_columns = list(target.columns.difference(source.columns))
@@ -66,17 +66,22 @@ class ObjectDict(Generic[ObjectItem], Mapping[str, ObjectItem]):
         return self._items.items()
 
     def difference(self, op: "ObjectDict[ObjectItem]") -> Iterable["ObjectItem"]:
-        for key, item in self.items():
-            if key not in op:
-                yield item
+        "Items whose key is absent from the other collection (in original order)."
+
+        op_items = op._items
+        return [item for key, item in self._items.items() if key not in op_items]
 
     def intersection(
         self, op: "ObjectDict[ObjectItem]"
     ) -> Iterable[tuple["ObjectItem", "ObjectItem"]]:
-        for key, item in self.items():
-            op_item = op.get(key)
-            if op_item is not None:
-                yield (item, op_item)
+        "Pairs of items that share the same key (in original order)."
+
+        op_items = op._items
+        return [
+            (item, op_items[key])
+            for key, item in self._items.items()
+            if key in op_items
+        ]
 
     def sort(self) -> None:
         self._items = dict(sorted(self._items.items()))
@@ -195,15 +195,9 @@ class SqlConverter:
                 if description is not None:
                     print(f":param {field.name}: {description}", file=out)
             paramstring = out.getvalue()
-        with StringIO() as out:
-            if table.description:
-                out.write(table.description)
-            if table.description and paramstring:
-                out.write("\n\n")
-            if paramstring:
-                out.write(paramstring)
-            docstring = out.getvalue()
-        typ.__doc__ = docstring
+        typ.__doc__ = "\n\n".join(
+            part for part in (table.description, paramstring) if part
+        )
 
         # assign the newly created type to the target module
         setattr(sys.modules[module.__name__], class_name, typ)
@@ -156,7 +156,7 @@ class QualifiedId:
                 + _qd
             )
         else:
-            return quote_delimiter + self.id.replace(quote_delimiter, f"{quote_delimiter}{quote_delimiter}") + quote_delimiter
+            return _qd + self.id.replace(_qd, f"{_qd}{_qd}") + _qd
 
     def rename(self, id: str) -> "SupportsQualifiedId":
         return QualifiedId(self.namespace, id)
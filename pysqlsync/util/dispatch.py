@@ -1,17 +1,29 @@
 import asyncio
 import functools
 import inspect
-from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, Coroutine, TypeVar
+from concurrent.futures import Executor
+from typing import Callable, Coroutine, Protocol, TypeVar
 
-from .typing import ParamSpec
+from .typing import Concatenate, ParamSpec
 
 R = TypeVar("R")
 P = ParamSpec("P")
 
 
-def thread_dispatch(fn: Callable[P, R]) -> Callable[P, Coroutine[None, None, R]]:
-    "A decorator to transform a synchronous function into an asynchronous function dispatched to a thread pool."
+class SupportsExecutor(Protocol):
+    "An object that runs its blocking calls on a dedicated executor."
+
+    @property
+    def executor(self) -> Executor: ...
+
+
+S = TypeVar("S", bound=SupportsExecutor)
+
+
+def thread_dispatch(
+    fn: Callable[Concatenate[S, P], R]
+) -> Callable[Concatenate[S, P], Coroutine[None, None, R]]:
+    "A decorator to transform a synchronous method into an asynchronous method dispatched to the object's executor."
 
     if not callable(fn):
         raise TypeError("expected: a callable")
@@ -20,11 +32,10 @@ def thread_dispatch(fn: Callable[P, R]) -> Callable[P, Coroutine[None, None, R]]
         raise TypeError("expected: a regular function; got: an async function")
 
     @functools.wraps(fn)
-    async def invoke(*args: P.args, **kwargs: P.kwargs) -> R:
+    async def invoke(self: S, /, *args: P.args, **kwargs: P.kwargs) -> R:
         loop = asyncio.get_running_loop()
-        with ThreadPoolExecutor(max_workers=1) as pool:
-            return await loop.run_in_executor(
-                pool, functools.partial(fn, *args, **kwargs)
-            )
+        return await loop.run_in_executor(
+            self.executor, functools.partial(fn, self, *args, **kwargs)
+        )
 
     return invoke
@@ -0,0 +1,23 @@
+import itertools
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    "Splits an iterable into lists of at most the given size, consuming the source lazily."
+
+    if size < 1:
+        raise ValueError(f"expected: positive chunk size; got: {size}")
+
+    if isinstance(items, list) and len(items) <= size:
+        if items:
+            yield items
+        return
+
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
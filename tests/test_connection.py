@@ -189,6 +189,55 @@ class TestPostgreSQLConnection(PostgreSQLBase, TestConnection):
         async with self.engine.create_connection(self.parameters) as conn:
             await conn.execute('DROP TYPE IF EXISTS "WorkflowState";')
 
+    async def test_upsert_data_duplicate(self) -> None:
+        options = GeneratorOptions(namespaces={tables: None})
+        async with self.engine.create_connection(self.parameters, options) as conn:
+            await conn.create_objects([tables.DataTable])
+
+            # the record that comes last wins when a batch has duplicate keys;
+            # small lists are upserted directly, unsized input goes through a staging table
+            for index, records in enumerate(
+                [
+                    [
+                        tables.DataTable(1, "a"),
+                        tables.DataTable(2, "b"),
+                        tables.DataTable(1, "c"),
+                    ],
+                    (
+                        tables.DataTable(k, v)
+                        for k, v in [(1, "d"), (2, "e"), (1, "f"), (2, "g")]
+                    ),
+                ]
+            ):
+                with self.subTest(index=index):
+                    await conn.upsert_data(tables.DataTable, records)
+                    self.assertEqual(
+                        await conn.query_one(int, 'SELECT COUNT(*) FROM "DataTable"'),
+                        2,
+                    )
+            self.assertEqual(
+                await conn.query_all(
+                    str, 'SELECT "data" FROM "DataTable" ORDER BY "id"'
+                ),
+                ["f", "g"],
+            )
+
+            # repeated staging table upserts within a caller transaction use savepoints
+            async with conn.native_connection.transaction():  # type: ignore
+                await conn.upsert_data(
+                    tables.DataTable, (r for r in [tables.DataTable(1, "h")])
+                )
+                await conn.upsert_data(
+                    tables.DataTable, (r for r in [tables.DataTable(2, "i")])
+                )
+            self.assertEqual(
+                await conn.query_all(
+                    str, 'SELECT "data" FROM "DataTable" ORDER BY "id"'
+                ),
+                ["h", "i"],
+            )
+            await conn.drop_objects()
+
 
 @unittest.skipUnless(has_env_var("MSSQL"), "Microsoft SQL tests are disabled")
 class TestMSSQLConnection(MSSQLBase, TestConnection):
@@ -3,6 +3,8 @@ import unittest
 
 from strong_typing.inspection import create_module
 
+from pysqlsync.dialect.postgresql.mutation import PostgreSQLMutator
+from pysqlsync.dialect.postgresql.object_types import sql_quoted_string
 from pysqlsync.formation.mutation import Mutator, MutatorOptions
 from pysqlsync.formation.object_types import (
     Column,
@@ -436,6 +438,34 @@ class TestConverter(unittest.TestCase):
             'ALTER TYPE "public"."WorkflowState"\n' "ADD VALUE 'unknown';",
         )
 
+        # a change in member description alone does not alter the data type
+        target = copy.deepcopy(source)
+        target_ns = target.namespaces["public"]
+        target_ns.structs["Coordinates"].members["lat"].description = "Latitude."
+        self.assertIsNone(Mutator().mutate_catalog_stmt(source, target))
+        self.assertEqual(
+            PostgreSQLMutator().mutate_catalog_stmt(source, target),
+            """COMMENT ON COLUMN "public"."Coordinates"."lat" IS 'Latitude.';""",
+        )
+        target_ns.structs["Coordinates"].members["lat"].description = None
+        self.assertEqual(
+            PostgreSQLMutator().mutate_catalog_stmt(source, target),
+            'COMMENT ON COLUMN "public"."Coordinates"."lat" IS NULL;',
+        )
+
+        # an empty description is the same as no description
+        source_ns = source.namespaces["public"]
+        target = copy.deepcopy(source)
+        target_ns = target.namespaces["public"]
+        source_ns.tables["Person"].description = None
+        target_ns.tables["Person"].description = ""
+        target_ns.tables["Person"].columns["id"].description = ""
+        source_ns.structs["Coordinates"].description = None
+        target_ns.structs["Coordinates"].description = ""
+        source_ns.structs["Coordinates"].members["lat"].description = None
+        target_ns.structs["Coordinates"].members["lat"].description = ""
+        self.assertIsNone(PostgreSQLMutator().mutate_catalog_stmt(source, target))
+
         source = module_to_catalog(
             user,
             options=DataclassConverterOptions(
@@ -472,6 +502,21 @@ class TestConverter(unittest.TestCase):
             'DROP COLUMN "deleted_at";',
         )
 
+    def test_quoted_string(self) -> None:
+        self.assertEqual(sql_quoted_string("it's"), "'it''s'")
+        self.assertEqual(
+            sql_quoted_string("árvíztűrő tükörfúrógép's"),
+            "'árvíztűrő tükörfúrógép''s'",
+        )
+        self.assertEqual(
+            sql_quoted_string("it's\na \\ b\tc\r\b\f"),
+            "E'it\\'s\\na \\\\ b\\tc\\r\\b\\f'",
+        )
+        self.assertEqual(
+            sql_quoted_string("árvíztűrő\ttükörfúrógép"),
+            "E'árvíztűrő\\ttükörfúrógép'",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
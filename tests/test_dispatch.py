@@ -0,0 +1,34 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pysqlsync.util.dispatch import thread_dispatch
+
+
+class Worker:
+    executor: ThreadPoolExecutor
+
+    def __init__(self) -> None:
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    @thread_dispatch
+    def get_thread(self, offset: int) -> tuple[int, int]:
+        return threading.get_ident(), offset
+
+
+class TestDispatch(unittest.IsolatedAsyncioTestCase):
+    async def test_thread_dispatch(self) -> None:
+        first, second = Worker(), Worker()
+        try:
+            first_thread, _ = await first.get_thread(0)
+            self.assertNotEqual(first_thread, threading.get_ident())
+            self.assertEqual(await first.get_thread(1), (first_thread, 1))
+            second_thread, _ = await second.get_thread(0)
+            self.assertNotEqual(second_thread, first_thread)
+        finally:
+            first.executor.shutdown()
+            second.executor.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
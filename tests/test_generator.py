@@ -4,8 +4,9 @@ from datetime import date, datetime, time, timedelta, timezone
 
 from strong_typing.inspection import DataclassInstance
 
-from pysqlsync.base import GeneratorOptions
+from pysqlsync.base import ClassRef, GeneratorOptions
 from pysqlsync.formation.py_to_sql import EnumMode
+from pysqlsync.model.id_types import LocalId
 from tests import tables
 from tests.params import (
     MSSQLBase,
@@ -700,6 +701,32 @@ class TestGenerator(TestEngineBase, unittest.TestCase):
             (2, "abc", "def", "ghi", "jkl"),
         )
 
+        # record builders are cached per table object, and dropped with the state
+        table = generator.state.get_table(
+            generator.get_qualified_id(ClassRef(tables.DataTable))
+        )
+        builder = generator._get_dataclass_record_builder(
+            table, tables.DataTable, skip_identity=False
+        )
+        self.assertIs(
+            generator._get_dataclass_record_builder(
+                table, tables.DataTable, skip_identity=False
+            ),
+            builder,
+        )
+        generator.create(tables=[tables.DataTable])
+        table = generator.state.get_table(
+            generator.get_qualified_id(ClassRef(tables.DataTable))
+        )
+        self.assertIsNot(
+            generator._get_dataclass_record_builder(
+                table, tables.DataTable, skip_identity=False
+            ),
+            builder,
+        )
+        generator.reset()
+        self.assertEqual(generator._record_builders, {})
+
     def test_table_data_datetime(self) -> None:
         generator = self.engine.create_generator(self.options)
         generator.create(tables=[tables.DateTimeTable])
@@ -816,6 +843,34 @@ class TestPostgreSQLGenerator(PostgreSQLBase, TestGenerator):
             ),
         )
 
+    def test_upsert_from_staging(self) -> None:
+        self.maxDiff = None
+
+        generator = self.engine.create_generator(self.options)
+        generator.create(tables=[tables.DataTable])
+        table = generator.state.get_table(
+            generator.get_qualified_id(ClassRef(tables.DataTable))
+        )
+        staging = LocalId("staging")
+        sequence = LocalId("sequence")
+
+        self.assertMultiLineEqual(
+            generator.get_staging_table_create_stmt(table, staging, sequence),  # type: ignore
+            'CREATE TEMPORARY TABLE "staging" ON COMMIT DROP AS\n'
+            'SELECT "id", "data" FROM "DataTable"\n'
+            "WITH NO DATA;\n"
+            'ALTER TABLE "staging" ADD COLUMN "sequence" bigint GENERATED ALWAYS AS IDENTITY;',
+        )
+        self.assertMultiLineEqual(
+            generator.get_table_upsert_from_stmt(table, staging, sequence),  # type: ignore
+            'INSERT INTO "DataTable"\n'
+            '("id", "data")\n'
+            'SELECT DISTINCT ON ("id") "id", "data" FROM "staging" ORDER BY "id", "sequence" DESC\n'
+            'ON CONFLICT ("id") DO UPDATE SET\n'
+            '"data" = EXCLUDED."data"\n'
+            ";",
+        )
+
 
 @unittest.skipUnless(has_env_var("MSSQL"), "Microsoft SQL tests are disabled")
 class TestMSSQLGenerator(MSSQLBase, TestGenerator):
@@ -0,0 +1,36 @@
+import unittest
+from typing import Iterator
+
+from pysqlsync.util.iterable import chunked
+
+
+class TestIterable(unittest.TestCase):
+    def test_chunked_size(self) -> None:
+        with self.assertRaises(ValueError):
+            list(chunked([1, 2, 3], 0))
+
+    def test_chunked_list(self) -> None:
+        items = [1, 2, 3]
+        chunks = list(chunked(items, 3))
+        self.assertEqual(len(chunks), 1)
+        self.assertIs(chunks[0], items)
+        self.assertEqual(list(chunked([], 3)), [])
+        self.assertEqual(list(chunked([1, 2, 3, 4], 3)), [[1, 2, 3], [4]])
+
+    def test_chunked_iterable(self) -> None:
+        consumed: list[int] = []
+
+        def generate() -> Iterator[int]:
+            for item in range(7):
+                consumed.append(item)
+                yield item
+
+        chunks = chunked(generate(), 3)
+        self.assertEqual(consumed, [])
+        self.assertEqual(next(chunks), [0, 1, 2])
+        self.assertEqual(consumed, [0, 1, 2])
+        self.assertEqual(list(chunks), [[3, 4, 5], [6]])
+
+
+if __name__ == "__main__":
+    unittest.main()